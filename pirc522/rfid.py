@@ -16,13 +16,17 @@ try:
     PIN_MODES_BOARD.append(GPIO.BOARD)
     PIN_MODES_BCM.append(GPIO.BCM)
 except ImportError:
-    pass
+    GPIO = None
 
 SPIClass = spidev.SpiDev
 def_pin_rst = 22
 def_pin_irq = 18
 def_pin_mode = 'BOARD_DEFAULT'
 
+# SPI address bytes for writing/reading each register, indexed by address
+REG_WRITE_CMD = tuple((addr << 1) & 0x7E for addr in range(0x40))
+REG_READ_CMD = tuple(cmd | 0x80 for cmd in REG_WRITE_CMD)
+
 
 class RFID(object):
     pin_rst = 22
@@ -82,6 +86,9 @@ class RFID(object):
 
     length = 16
 
+    # How often read_id() runs anti-collision before giving up on a tag
+    anticoll_attempts = 2
+
     antenna_gain = 0x04
 
     # antenna_gain
@@ -99,7 +106,7 @@ class RFID(object):
     authed = False
     irq = threading.Event()
 
-    def __init__(self, bus=0, device=0, speed=1000000, pin_rst=None,
+    def __init__(self, bus=0, device=0, speed=8000000, pin_rst=None,
                  pin_ce=0, pin_irq=None, pin_mode=def_pin_mode,
                  antenna_gain=None):
         if not pin_rst:
@@ -115,9 +122,19 @@ class RFID(object):
         self.pin_ce = pin_ce
         self.pin_irq = pin_irq
 
+        # Preallocated read frames for the registers polled in hot loops
+        self._rd_buf = {
+            addr: bytearray([REG_READ_CMD[addr], 0])
+            for addr in (self.addr_ComIrqReq, self.addr_DivIrqReg,
+                         self.addr_ErrorReg, self.addr_FIFOLevelReg,
+                         self.addr_ControlReg)
+        }
+
         self.spi = SPIClass()
         self.spi.open(bus, device)
         if board == RASPBERRY:
+            # The MFRC522 supports up to 10 MHz; pass a lower speed= if the
+            # wiring is long or the module misbehaves
             self.spi.max_speed_hz = speed
         else:
             self.spi.mode = 0
@@ -134,11 +151,6 @@ class RFID(object):
             self.output_rst = gpiozero.OutputDevice(self.pin(pin_rst))
             self.output_rst.on()
 
-        # Ignore IRQ if we did not wire this
-        if self.pin_irq is not None:
-            self.input_irq = gpiozero.DigitalInputDevice(self.pin(pin_irq), pull_up=True)
-            self.input_irq.when_deactivated = self.irq_callback
-
         # Change the antenna gain
         if antenna_gain is not None:
             self.antenna_gain = antenna_gain
@@ -146,46 +158,131 @@ class RFID(object):
         if pin_ce != 0:
             self.output_ce = gpiozero.OutputDevice(self.pin(pin_ce))
             self.output_ce.on()
+            # Toggled around every frame, so skip the device level wrapper
+            self._ce_pin = self.output_ce.pin
+
+        # Ignore IRQ if we did not wire this
+        self.gpio_irq = False
+        if self.pin_irq is not None:
+            self.gpio_irq = self.setup_gpio_irq(pin_irq, pin_mode)
+            if not self.gpio_irq:
+                self.input_irq = gpiozero.DigitalInputDevice(self.pin(pin_irq), pull_up=True)
+                self.input_irq.when_activated = self.irq_callback
         self.init()
 
+    def setup_gpio_irq(self, pin_irq, pin_mode):
+        """
+        Sets up IRQ edge detection using RPi.GPIO, which is lighter than
+        gpiozero's edge handling.
+        Returns False if RPi.GPIO is unavailable, uses a different pin
+        numbering or cannot detect edges (/sys/class/gpio-less kernels).
+        """
+        if GPIO is None:
+            return False
+        mode = GPIO.BOARD if pin_mode in PIN_MODES_BOARD else GPIO.BCM
+        if GPIO.getmode() not in (None, mode):
+            return False
+        try:
+            GPIO.setmode(mode)
+            GPIO.setup(pin_irq, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            GPIO.add_event_detect(pin_irq, GPIO.FALLING,
+                                  callback=lambda channel: self.irq_callback())
+        except RuntimeError as e:
+            logger.info(f'RPi.GPIO edge detection unavailable ({e}), '
+                        'falling back to gpiozero')
+            GPIO.cleanup(pin_irq)
+            return False
+        return True
+
     def disable_interrupts(self):
-        self.dev_write(self.addr_ComIrqReq, 0x14)
-        self.dev_write(self.addr_ComIEnReg, 0x80)
-        self.dev_write(self.addr_DivIEnReg, 0x00)
-        self.dev_write(self.addr_DivIrqReg, 0x00)
+        self.dev_write_many([
+            (self.addr_ComIrqReq, 0x14),
+            (self.addr_ComIEnReg, 0x80),
+            (self.addr_DivIEnReg, 0x00),
+            (self.addr_DivIrqReg, 0x00),
+        ])
 
     def init(self):
         self.reset()
         self.disable_interrupts()
-        self.dev_write(self.addr_TModeReg, 0x8D)
-        self.dev_write(self.addr_TPrescalerReg, 0x3E)
-        self.dev_write(self.addr_TReloadReg2D, 30)
-        self.dev_write(self.addr_TReloadReg2C, 0)
-        self.dev_write(self.addr_TxASKReg, 0x40)
-        self.dev_write(self.addr_ModeReg, 0x3D)
+        self.dev_write_many([
+            (self.addr_TModeReg, 0x8D),
+            (self.addr_TPrescalerReg, 0x3E),
+            (self.addr_TReloadReg2D, 30),
+            (self.addr_TReloadReg2C, 0),
+            (self.addr_TxASKReg, 0x40),
+            (self.addr_ModeReg, 0x3D),
+        ])
         self.set_antenna_gain(self.antenna_gain)
         self.set_antenna(True)
 
-    def spi_transfer(self, data):
+    def spi_transfer(self, data, readback=True):
+        """
+        Transfers data in a single frame.
+        With readback=False, the data is only written and None is returned.
+        """
         if self.pin_ce != 0:
-            self.output_ce.off()
-        r = self.spi.xfer2(data)
+            self._ce_pin.state = False
+        if readback:
+            # Deliberately not xfer3(): it would split transfers above
+            # spidev's bufsiz into several frames, which the MFRC522 reads
+            # as new address bytes. xfer2() rejects them instead.
+            r = self.spi.xfer2(data)
+        else:
+            r = self.spi.writebytes2(data)
         if self.pin_ce != 0:
-            self.output_ce.on()
+            self._ce_pin.state = True
         return r
 
     def dev_write(self, address, value):
-        self.spi_transfer([(address << 1) & 0x7E, value])
+        if address in self._shadow:
+            self._shadow[address] = value
+        self.spi_transfer([REG_WRITE_CMD[address], value], readback=False)
+
+    def dev_write_many(self, pairs):
+        """
+        Writes a table of (address, value) pairs, one dev_write() each.
+        The MFRC522 treats every byte after the address byte of a frame as
+        data for that same address, so the pairs cannot share a frame.
+        """
+        for address, value in pairs:
+            self.dev_write(address, value)
+
+    def fifo_write(self, data):
+        """
+        Writes all bytes of data to the FIFO in a single frame.
+        Every byte following the address byte is written to FIFODataReg.
+        """
+        if data:
+            self.spi_transfer(bytes([REG_WRITE_CMD[self.addr_FIFODataReg]]) +
+                              bytes(data), readback=False)
 
     def dev_read(self, address):
-        return self.spi_transfer([((address << 1) & 0x7E) | 0x80, 0])[1]
+        return self.spi_transfer([REG_READ_CMD[address], 0])[1]
+
+    def _dev_read_fast(self, address):
+        return self.spi_transfer(self._rd_buf[address])[1]
+
+    def fifo_read(self, n):
+        """
+        Reads n bytes from the FIFO in a single frame.
+        Each repeated FIFODataReg address byte pops the next FIFO byte; the
+        data for each address arrives one byte later, hence the trailing 0.
+        """
+        return self.spi_transfer([REG_READ_CMD[self.addr_FIFODataReg]] * n + [0])[1:]
 
     def set_bitmask(self, address, mask):
-        current = self.dev_read(address)
+        if address in self._shadow:
+            current = self._shadow[address]
+        else:
+            current = self.dev_read(address)
         self.dev_write(address, current | mask)
 
     def clear_bitmask(self, address, mask):
-        current = self.dev_read(address)
+        if address in self._shadow:
+            current = self._shadow[address]
+        else:
+            current = self.dev_read(address)
         self.dev_write(address, current & (~mask))
 
     def set_antenna(self, state):
@@ -208,7 +305,7 @@ class RFID(object):
             raise ValueError('Antenna gain has to be in the range 0...7')
 
     def card_write(self, command, data):
-        back_data = []
+        back_data = bytearray()
         back_length = 0
         error = False
         irq = 0x00
@@ -223,30 +320,52 @@ class RFID(object):
             irq = 0x77
             irq_wait = 0x30
 
-        self.dev_write(self.addr_ComIEnReg, irq | 0x80)
-        self.clear_bitmask(self.addr_ComIrqReq, 0x80)
+        if self.pin_irq is not None:
+            # Clear stale flags first so enabling the sources does not pull
+            # the IRQ line. Only completion or the timer may drive it.
+            self.dev_write(self.addr_ComIrqReq, 0x7F)
+            self.dev_write(self.addr_ComIEnReg, irq_wait | 0x01 | 0x80)
+        else:
+            self.dev_write(self.addr_ComIEnReg, irq | 0x80)
+            self.clear_bitmask(self.addr_ComIrqReq, 0x80)
+        self.irq.clear()
         self.set_bitmask(self.addr_FIFOLevelReg, 0x80)
         self.dev_write(self.addr_CommandReg, self.mode_idle)
 
-        for i in range(len(data)):
-            self.dev_write(self.addr_FIFODataReg, data[i])
+        self.fifo_write(data)
 
         self.dev_write(self.addr_CommandReg, command)
 
         if command == self.mode_transrec:
             self.set_bitmask(self.addr_BitFramingReg, 0x80)
 
-        i = 2000
-        while True:
-            n = self.dev_read(self.addr_ComIrqReq)
-            i -= 1
-            if ~((i != 0) and ~(n & 0x01) and ~(n & irq_wait)):
-                break
+        if self.pin_irq is not None:
+            # A late edge from an earlier command may wake us early, so keep
+            # waiting until completion, timer timeout or the deadline
+            deadline = time.time() + 0.05
+            while True:
+                self.irq.wait(max(0, deadline - time.time()))
+                self.irq.clear()
+                n = self._dev_read_fast(self.addr_ComIrqReq)
+                if (n & (irq_wait | 0x01)) or time.time() >= deadline:
+                    break
+            # i != 0 signals completion, just like with the polling loop
+            i = 1 if n & irq_wait else 0
+        else:
+            # Hoist lookups out of this up to 2000 iteration loop
+            transfer = self.spi_transfer
+            frame = self._rd_buf[self.addr_ComIrqReq]
+            i = 2000
+            while True:
+                n = transfer(frame)[1]
+                i -= 1
+                if ~((i != 0) and ~(n & 0x01) and ~(n & irq_wait)):
+                    break
 
         self.clear_bitmask(self.addr_BitFramingReg, 0x80)
 
         if i != 0:
-            if (self.dev_read(self.addr_ErrorReg) & 0x1B) == 0x00:
+            if (self._dev_read_fast(self.addr_ErrorReg) & 0x1B) == 0x00:
                 error = False
 
                 if n & irq & 0x01:
@@ -254,8 +373,8 @@ class RFID(object):
                     error = True
 
                 if command == self.mode_transrec:
-                    n = self.dev_read(self.addr_FIFOLevelReg)
-                    last_bits = self.dev_read(self.addr_ControlReg) & 0x07
+                    n = self._dev_read_fast(self.addr_FIFOLevelReg)
+                    last_bits = self._dev_read_fast(self.addr_ControlReg) & 0x07
                     if last_bits != 0:
                         back_length = (n - 1) * 8 + last_bits
                     else:
@@ -267,8 +386,7 @@ class RFID(object):
                     if n > self.length:
                         n = self.length
 
-                    for i in range(n):
-                        back_data.append(self.dev_read(self.addr_FIFODataReg))
+                    back_data.extend(self.fifo_read(n))
             else:
                 logger.warning("Error E2")
                 error = True
@@ -290,13 +408,13 @@ class RFID(object):
             return None
 
         # Get the UID
-        error, uid = self.anticoll()
+        error, uid = self._anticoll_retry(self.act_anticl)
         if error:
             return None
 
         # Do we have an incomplete UID?!
         if uid[0] != 0x88:
-            return int.from_bytes(uid[0:4], 'big') if as_number else uid[0:4]
+            return int.from_bytes(uid[0:4], 'big') if as_number else list(uid[0:4])
 
         # Activate the tag with the incomplete UID
         error = self.select_tag(uid)
@@ -304,7 +422,7 @@ class RFID(object):
             return None
 
         # Get the remaining bytes
-        error, uid2 = self.anticoll2()
+        error, uid2 = self._anticoll_retry(self.act_anticl2)
         if error:
             return None
 
@@ -312,7 +430,7 @@ class RFID(object):
 
         # Build the final UID without checksums
         real_uid = uid[1:-1] + uid2[:-1]
-        return int.from_bytes(real_uid, 'big') if as_number else real_uid
+        return int.from_bytes(real_uid, 'big') if as_number else list(real_uid)
 
     def request(self, req_mode=0x26):
         """
@@ -335,49 +453,42 @@ class RFID(object):
         Anti-collision detection.
         Returns tuple of (error state, tag ID).
         """
-        back_data = []
-        serial_number = []
-
-        serial_number_check = 0
-
-        self.dev_write(self.addr_BitFramingReg, 0x00)
-        serial_number.append(self.act_anticl)
-        serial_number.append(0x20)
-
-        (error, back_data, back_bits) = self.card_write(self.mode_transrec, serial_number)
-        if not error:
-            if len(back_data) == 5:
-                for i in range(4):
-                    serial_number_check = serial_number_check ^ back_data[i]
-
-                if serial_number_check != back_data[4]:
-                    error = True
-            else:
-                error = True
-
-        return (error, back_data)
+        error, back_data = self._anticoll(self.act_anticl)
+        return (error, list(back_data))
 
     def anticoll2(self):
         """
         Anti-collision detection.
         Returns tuple of (error state, tag ID).
         """
-        back_data = []
-        serial_number = []
+        error, back_data = self._anticoll(self.act_anticl2)
+        return (error, list(back_data))
 
-        serial_number_check = 0
+    def _anticoll_retry(self, act):
+        """
+        Runs _anticoll() up to anticoll_attempts times (at least once), so
+        that a transient collision or checksum error does not drop the tag
+        from the ready state and force a new request().
+        """
+        for attempt in range(max(1, self.anticoll_attempts)):
+            error, back_data = self._anticoll(act)
+            if not error:
+                break
+            logger.debug(f'anti-collision attempt {attempt + 1} failed')
+        return (error, back_data)
 
+    def _anticoll(self, act):
+        """
+        Runs anti-collision for the cascade level selected by act.
+        Returns tuple of (error state, tag ID and checksum as bytearray).
+        """
         self.dev_write(self.addr_BitFramingReg, 0x00)
-        serial_number.append(self.act_anticl2)
-        serial_number.append(0x20)
 
-        (error, back_data, back_bits) = self.card_write(self.mode_transrec, serial_number)
+        (error, back_data, back_bits) = self.card_write(self.mode_transrec, [act, 0x20])
         if not error:
             if len(back_data) == 5:
-                for i in range(4):
-                    serial_number_check = serial_number_check ^ back_data[i]
-
-                if serial_number_check != back_data[4]:
+                if (back_data[0] ^ back_data[1] ^ back_data[2] ^
+                        back_data[3]) != back_data[4]:
                     error = True
             else:
                 error = True
@@ -388,13 +499,14 @@ class RFID(object):
         self.clear_bitmask(self.addr_DivIrqReg, 0x04)
         self.set_bitmask(self.addr_FIFOLevelReg, 0x80)
 
-        for i in range(len(data)):
-            self.dev_write(self.addr_FIFODataReg, data[i])
+        self.fifo_write(data)
         self.dev_write(self.addr_CommandReg, self.mode_crc)
 
+        transfer = self.spi_transfer
+        frame = self._rd_buf[self.addr_DivIrqReg]
         i = 255
         while True:
-            n = self.dev_read(self.addr_DivIrqReg)
+            n = transfer(frame)[1]
             i -= 1
             if not ((i != 0) and not (n & 0x04)):
                 break
@@ -492,7 +604,7 @@ class RFID(object):
         if len(back_data) != 16:
             error = True
 
-        return (error, back_data)
+        return (error, list(back_data))
 
     def write(self, block_address, data):
         """
@@ -540,29 +652,53 @@ class RFID(object):
         start_time = time.time()
         waiting = True
         while waiting and (timeout == 0 or ((time.time() - start_time) < timeout)):
-            self.init()
-            self.dev_write(self.addr_ComIrqReq, 0x00)
-            self.dev_write(self.addr_ComIEnReg, 0xA0)
-
             # Even when using the interrupt line this is needed
             # to force the controller to re-scan regularly:
-            self.dev_write(self.addr_FIFODataReg, 0x26)
-            self.dev_write(self.addr_CommandReg, 0x0C)
-            self.dev_write(self.addr_BitFramingReg, 0x87)
+            self._rearm_detect()
             waiting = not self.irq.wait(0.1)
         self.irq.clear()
         self.init()
 
+    def _rearm_detect(self):
+        """
+        Starts another REQA scan without running a full init().
+        As there was no reset since the last scan, the previous command is
+        stopped, stale interrupt flags are cleared and the FIFO is flushed
+        explicitly.
+        """
+        self.dev_write_many([
+            (self.addr_CommandReg, self.mode_idle),
+            (self.addr_ComIrqReq, 0x7F),
+            (self.addr_ComIEnReg, 0xA0),
+            (self.addr_FIFOLevelReg, 0x80),
+            (self.addr_FIFODataReg, self.act_reqidl),
+            (self.addr_CommandReg, self.mode_transrec),
+            (self.addr_BitFramingReg, 0x87),
+        ])
+
     def reset(self):
         authed = False
+        # Cached values of registers whose writable bits are only changed by
+        # us, as set by the soft reset. set_bitmask()/clear_bitmask() use
+        # these instead of reading the register first. Status2Reg is not
+        # cached as the chip sets MFCrypto1On itself.
+        self._shadow = {
+            self.addr_FIFOLevelReg: 0x00,
+            self.addr_BitFramingReg: 0x00,
+            self.addr_TxControlReg: 0x80,
+        }
         self.dev_write(self.addr_CommandReg, self.mode_reset)
 
     def cleanup(self):
         """
-        Calls stop_crypto() if needed
+        Calls stop_crypto() if needed and releases the RPi.GPIO IRQ handler
         """
         if self.authed:
             self.stop_crypto()
+        if self.gpio_irq:
+            GPIO.remove_event_detect(self.pin_irq)
+            GPIO.cleanup(self.pin_irq)
+            self.gpio_irq = False
 
     def util(self):
         """
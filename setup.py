@@ -34,5 +34,5 @@ setup(
     author_email='ondryaso@ondryaso.eu',
     url='https://github.com/hoffie/pi-rc522-gpiozero',
     license='MIT',
-    install_requires=['spidev', 'gpiozero'],
+    install_requires=['spidev>=3.4', 'gpiozero'],
 )